@@ -1,10 +1,15 @@
 #!/usr/bin/env python3
 
+import functools
+import hashlib
 import os
+import re
+import shutil
+import socket
 import sys
 import json
 import time
-import requests
+import threading
 import subprocess
 from pathlib import Path
 from dotenv import load_dotenv
@@ -14,7 +19,17 @@ from rich.panel import Panel
 from rich import box
 from rich.text import Text
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeRemainingColumn
-from rich.syntax import Syntax
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is in requirements, but parse fine without it
+    orjson = None
+
+
+def _json_loads(data):
+    """Parse JSON bytes/str with orjson when available (C parser, ~5x faster)."""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
 
 # Initialize rich console
 console = Console()
@@ -34,6 +49,134 @@ LANGUAGE_MAP = {
     'zh': {'code': 'zh_CN', 'voice': 'zh-CN-xiaoyu', 'name': 'Chinese'}
 }
 FIREBASE_EMULATOR_URL = "http://127.0.0.1:5001/project-4261681351/us-central1"
+EMULATOR_UI_URL = "http://127.0.0.1:4000"
+
+# Function endpoints and their display lines, interned once at import instead
+# of re-interpolated on every configuration/status render.
+_FUNCTION_ENDPOINTS = {
+    name: f"{FIREBASE_EMULATOR_URL}/{name}"
+    for name in ('dubVideo', 'handleDubbing', 'handleMention')
+}
+_EMULATOR_ENDPOINT_LINES = (
+    f"  UI:           {EMULATOR_UI_URL}\n",
+    f"  dubVideo:     {_FUNCTION_ENDPOINTS['dubVideo']}\n",
+    f"  handleDubbing:{_FUNCTION_ENDPOINTS['handleDubbing']}\n",
+    f"  handleMention:{_FUNCTION_ENDPOINTS['handleMention']}\n",
+)
+
+_LANG_CODES = tuple(LANGUAGE_MAP)
+_LANG_DISPLAY_LINES = tuple(
+    (code, f"{info['name']} ({info['code']})") for code, info in LANGUAGE_MAP.items()
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _guess_mime(suffix):
+    """Memoized MIME lookup by extension (mimetypes parses its DB lazily)."""
+    import mimetypes
+    return mimetypes.guess_type('x' + suffix)[0] or 'video/mp4'
+
+
+MENU_ITEMS = (
+    ("1", "Environment Check", "Verify tools and API access"),
+    ("2", "Test Video Download", "Download video from a tweet"),
+    ("3", "Test Audio Extraction", "Extract audio from a local video file"),
+    ("4", "Test Murf Dubbing", "Send a local video file to Murf and poll"),
+    ("5", "Test Complete Flow", "Run the full backend dubbing process"),
+    ("6", "View Logs", "Show recent Firebase function logs"),
+    ("7", "Firebase Emulator", "Check emulator status"),
+    ("8", "Configuration", "View current project configuration"),
+    ("q", "Quit", "Exit the application")
+)
+
+# Cached startup state (prebuilt menu text) lives in the platform config dir
+# and is keyed by a fingerprint of the interpreter, library versions, and this
+# file's mtime, so upgrades and edits invalidate it automatically.
+_STATE_DIR = Path(os.environ.get('XDG_CONFIG_HOME', str(Path.home() / '.config'))) / 'twitter-dubber'
+_STATE_FILE = _STATE_DIR / 'cli-state.json'
+
+# Tool-version probe results change only on upgrades; cache them on disk so
+# repeat visits to the configuration screen skip the subprocess forks.
+# Pass --refresh-versions to drop the cache.
+_CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME', str(Path.home() / '.cache'))) / 'twitter-bot'
+_VERSIONS_FILE = _CACHE_DIR / 'versions.json'
+# show_configuration fills the cache from several worker threads at once;
+# serialize the read-merge-write so concurrent misses don't clobber each other.
+_VERSIONS_LOCK = threading.Lock()
+
+
+_TS_RE = re.compile(rb"\[(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d+Z)\]")
+_PERCENT_RE = re.compile(r"\[download\]\s+(\d+(?:\.\d+)?)%")
+
+# Log lines worth keeping: our functions plus useful levels. Compiled into a
+# single alternation so each line is scanned once instead of once per keyword.
+_LOG_KEYWORDS = (
+    b'functions[', b'us-central1-', b'dubVideo', b'handleDubbing', b'handleMention',
+    b'Created Murf Job', b'Dubbed video URL', b'Downloading video', b'Video downloaded successfully',
+    b'Murf', b'ERROR', b'INFO', b'[error]', b'[info]'
+)
+_KW_RE = re.compile(b'|'.join(re.escape(k) for k in _LOG_KEYWORDS))
+
+
+def _tail_lines(path, count):
+    """Return the last `count` lines of a file as bytes, without reading it all.
+
+    Memory-maps the file and walks backward for newlines, so only the tail
+    pages are faulted in even for multi-MB emulator logs. Lines stay bytes so
+    callers can filter without decoding what they will discard.
+    """
+    import mmap
+    with open(path, 'rb') as fh:
+        try:
+            mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file cannot be mapped
+            return []
+        with mm:
+            end = mm.size()
+            pos = end
+            if pos and mm[pos - 1:pos] == b'\n':
+                pos -= 1  # don't count the trailing line terminator
+            seen = 0
+            while seen < count:
+                i = mm.rfind(b'\n', 0, pos)
+                if i < 0:
+                    pos = 0
+                    break
+                pos = i
+                seen += 1
+            start = pos + 1 if pos else 0
+            return bytes(mm[start:end]).splitlines()
+
+
+def _list_by_mtime(path, predicate=None):
+    """List files in `path` newest-first, reading mtimes off the cached DirEntry."""
+    try:
+        with os.scandir(path) as it:
+            entries = [e for e in it if e.is_file() and (predicate is None or predicate(e.name))]
+    except OSError:
+        return []
+    entries.sort(key=lambda e: e.stat().st_mtime, reverse=True)
+    return [Path(e.path) for e in entries]
+
+
+class _ProgressWriter:
+    """File-like wrapper that reports bytes written to a callback."""
+
+    def __init__(self, f, callback):
+        self.f = f
+        self.callback = callback
+
+    def write(self, b):
+        n = self.f.write(b)
+        self.callback(len(b))
+        return n
+
+
+def _state_fingerprint():
+    """Fingerprint of everything that can change the rendered menu."""
+    from importlib.metadata import version
+    raw = f"{sys.version}|{version('rich')}|{version('requests')}|{os.path.getmtime(__file__)}"
+    return hashlib.sha1(raw.encode()).hexdigest()
 
 class TwitterDubberCLI:
     """An interactive CLI for testing the Twitter Dubbing Bot."""
@@ -55,17 +198,143 @@ class TwitterDubberCLI:
         self.downloads_dir = Path(__file__).parent / "downloads"
         self.dubbed_dir = Path(__file__).parent / "dubbed"
         self.repo_root = Path(__file__).resolve().parents[1]
+        self._menu_lines = self._load_cached_state()
+        # The menu is re-rendered after every submenu; build the panels and
+        # the prompt choices once instead of per iteration of run().
+        header_text = Text("Twitter Video Dubber CLI\n", style=self.theme['primary'], justify="center")
+        header_text.append("Interactive testing tool for the Twitter Video Dubbing Bot", style=self.theme['secondary'])
+        self._header_panel = Panel(header_text, border_style=self.theme['panel_border'], title="Welcome")
+        menu_text = Text()
+        for text, style in self._menu_lines:
+            menu_text.append(text, style=style)
+        self._menu_panel = Panel(menu_text, title="Main Menu", border_style=self.theme['panel_border'])
+        self._choices = tuple(item[0] for item in MENU_ITEMS)
+
+    @functools.cached_property
+    def _session(self):
+        """One pooled session for every network call, built on first use.
+
+        Importing requests pulls urllib3 and charset_normalizer, which
+        dominates cold start; deferring it here keeps the menu render free of
+        network machinery. Pooling lets the Murf poll loop and the emulator
+        probes reuse connections instead of re-handshaking, and connect=0
+        keeps probes against a stopped emulator failing fast.
+        """
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, connect=0, backoff_factor=0.5, status_forcelist=[502, 503, 504])
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        # The emulator functions are GETs with heavy side effects (dubVideo
+        # runs the whole download/dub/upload pipeline), so a transient 502
+        # must not re-run them. requests picks the longest matching mount
+        # prefix, so this opts the function endpoints out of retries while
+        # Murf polls and file downloads keep the policy above.
+        session.mount(FIREBASE_EMULATOR_URL, HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=16,
+            max_retries=0
+        ))
+        session.headers['User-Agent'] = 'twitter-dubber-cli'
+        return session
+
+    async def _poll_murf_job(self, job_id, api_key, deadline_s=360):
+        """Poll a Murf job until completion; return its download URL or None.
+
+        Runs as a coroutine over one HTTP/2 connection so a future batch mode
+        can asyncio.gather several jobs, overlapping one job's polling with
+        another's upload or download. Backoff starts at 0.5s and doubles to a
+        10s cap; a Retry-After header from Murf overrides the computed delay.
+        """
+        import asyncio
+        import httpx
+
+        delay = 0.5
+        deadline = time.monotonic() + deadline_s
+        async with httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(30),
+            limits=httpx.Limits(max_keepalive_connections=8),
+            headers={'User-Agent': 'twitter-dubber-cli'}
+        ) as client:
+            while time.monotonic() < deadline:
+                status_resp = await client.get(
+                    f'https://api.murf.ai/v1/murfdub/jobs/{job_id}/status',
+                    headers={ 'api-key': api_key }
+                )
+                status_resp.raise_for_status()
+                data = _json_loads(status_resp.content)
+                status = data.get('status')
+                if status == 'COMPLETED':
+                    details = next((d for d in data.get('download_details', []) if d.get('download_url')), None)
+                    if not details:
+                        raise RuntimeError('Murf completed, but no download details found')
+                    return details['download_url']
+                if status == 'FAILED':
+                    raise RuntimeError(f"Murf failed: {data.get('failure_reason') or 'Unknown error'}")
+                retry_after = status_resp.headers.get('Retry-After')
+                if retry_after:
+                    try:
+                        delay = min(float(retry_after), 10.0)
+                    except ValueError:
+                        pass
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 10.0)
+        return None
+
+    def _build_menu_lines(self):
+        """Derive the (text, style) pairs that make up the main menu body."""
+        lines = []
+        for key, desc, hint in MENU_ITEMS:
+            lines.append((f" {key} ", f"bold {self.theme['accent']}"))
+            lines.append((f"{desc}\n", "white"))
+            lines.append((f"   {hint}\n\n", self.theme['secondary']))
+        return lines
+
+    def _load_cached_state(self):
+        """Load the prebuilt menu state from the config dir, rebuilding on miss.
+
+        Set TDCLI_DEV=1 to bypass the cache while hacking on the CLI.
+        """
+        if os.environ.get('TDCLI_DEV') == '1':
+            return self._build_menu_lines()
+
+        fingerprint = _state_fingerprint()
+        try:
+            state = json.loads(_STATE_FILE.read_text())
+            if state.get('fingerprint') == fingerprint:
+                return [tuple(line) for line in state['menu_lines']]
+        except (OSError, ValueError, KeyError):
+            pass
+
+        lines = self._build_menu_lines()
+        try:
+            _STATE_DIR.mkdir(parents=True, exist_ok=True)
+            _STATE_FILE.write_text(json.dumps({'fingerprint': fingerprint, 'menu_lines': lines}))
+        except OSError:
+            pass
+        return lines
 
     def _get_latest_download(self):
         """Return the most recent video file in the downloads directory, or None."""
-        if not self.downloads_dir.exists():
-            return None
-        candidates = []
-        for suffix in (".mp4", ".mov", ".mkv", ".webm"):
-            candidates.extend(self.downloads_dir.glob(f"*{suffix}"))
-        if not candidates:
+        try:
+            with os.scandir(self.downloads_dir) as it:
+                best = max(
+                    (e for e in it
+                     if e.is_file() and e.name.lower().endswith((".mp4", ".mov", ".mkv", ".webm"))),
+                    key=lambda e: e.stat().st_mtime,
+                    default=None
+                )
+        except OSError:
             return None
-        return max(candidates, key=lambda p: p.stat().st_mtime)
+        return Path(best.path) if best is not None else None
 
     def run(self):
         """Main loop for the CLI application."""
@@ -79,37 +348,13 @@ class TwitterDubberCLI:
     def show_main_menu(self):
         """Display the main menu and handle user input."""
         self.console.clear()
-
-        # Header
-        header_text = Text("Twitter Video Dubber CLI\n", style=self.theme['primary'], justify="center")
-        header_text.append("Interactive testing tool for the Twitter Video Dubbing Bot", style=self.theme['secondary'])
-        self.console.print(Panel(header_text, border_style=self.theme['panel_border'], title="Welcome"))
-
-        # Menu Items
-        menu_text = Text()
-        menu_items = [
-            ("1", "Environment Check", "Verify tools and API access"),
-            ("2", "Test Video Download", "Download video from a tweet"),
-            ("3", "Test Audio Extraction", "Extract audio from a local video file"),
-            ("4", "Test Murf Dubbing", "Send a local video file to Murf and poll"),
-            ("5", "Test Complete Flow", "Run the full backend dubbing process"),
-            ("6", "View Logs", "Show recent Firebase function logs"),
-            ("7", "Firebase Emulator", "Check emulator status"),
-            ("8", "Configuration", "View current project configuration"),
-            ("q", "Quit", "Exit the application")
-        ]
-
-        for key, desc, hint in menu_items:
-            menu_text.append(f" {key} ", style=f"bold {self.theme['accent']}")
-            menu_text.append(f"{desc}\n", style="white")
-            menu_text.append(f"   {hint}\n\n", style=self.theme['secondary'])
-
-        self.console.print(Panel(menu_text, title="Main Menu", border_style=self.theme['panel_border']))
+        self.console.print(self._header_panel)
+        self.console.print(self._menu_panel)
 
         # Prompt
         choice = Prompt.ask(
             "Select an option",
-            choices=[item[0] for item in menu_items],
+            choices=self._choices,
             show_choices=False,
             show_default=False
         )
@@ -143,25 +388,194 @@ class TwitterDubberCLI:
             if not Confirm.ask("\nReturn to the main menu?", default=True):
                 raise KeyboardInterrupt
 
+    def _capture_output(self, command):
+        """Run a command quietly and return its stdout (raises on failure).
+
+        Unlike _run_subprocess this owns no live progress display, so several
+        probes can run concurrently from worker threads.
+        """
+        # DEVNULL stdin keeps tools like firebase from blocking on a TTY read
+        process = subprocess.run(command, capture_output=True, text=True, stdin=subprocess.DEVNULL)
+        if process.returncode != 0:
+            raise subprocess.CalledProcessError(
+                process.returncode, command, output=process.stdout, stderr=process.stderr
+            )
+        return process.stdout
+
+    def _cached_output(self, command, ttl_seconds=86400, key_extra=''):
+        """Like _capture_output, but memoized on disk for ttl_seconds."""
+        key = hashlib.sha1((' '.join(command) + key_extra).encode()).hexdigest()
+        try:
+            cache = _json_loads(_VERSIONS_FILE.read_bytes())
+        except (OSError, ValueError):
+            cache = {}
+        entry = cache.get(key)
+        if entry and time.time() - entry['ts'] < ttl_seconds:
+            return entry['value']
+        value = self._capture_output(command)
+        # Re-read under the lock and merge before writing: peer threads may
+        # have stored their entries since the optimistic read above.
+        with _VERSIONS_LOCK:
+            try:
+                cache = _json_loads(_VERSIONS_FILE.read_bytes())
+            except (OSError, ValueError):
+                cache = {}
+            cache[key] = {'ts': time.time(), 'value': value}
+            try:
+                _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                _VERSIONS_FILE.write_text(json.dumps(cache))
+            except OSError:
+                pass
+        return value
+
     def _run_subprocess(self, command, task_description):
-        """Run a subprocess with a progress indicator."""
+        """Run a subprocess, streaming its output line by line into the progress display."""
+        output_lines = []
         with Progress(
             SpinnerColumn(style=self.theme['accent']),
             TextColumn("[progress.description]{task.description}"),
             console=self.console,
             transient=True
         ) as progress:
-            progress.add_task(description=task_description, total=None)
-            process = subprocess.run(command, capture_output=True, text=True)
-        
-        if process.returncode != 0:
+            task = progress.add_task(description=task_description, total=None)
+            process = subprocess.Popen(
+                command,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                bufsize=1
+            )
+            for line in process.stdout:
+                output_lines.append(line)
+                # Surface yt-dlp's "[download]  NN%" lines as live progress
+                m = _PERCENT_RE.search(line)
+                if m:
+                    progress.update(task, description=f"{task_description} {m.group(1)}%")
+            process.stdout.close()
+            returncode = process.wait()
+
+        output = ''.join(output_lines)
+        if returncode != 0:
             self.console.print(Panel(
-                process.stderr,
+                output,
                 title="Subprocess Error",
                 border_style=self.theme['error']
             ))
-            process.check_returncode()  # Raise CalledProcessError
-        return process.stdout
+            raise subprocess.CalledProcessError(returncode, command, output=output)
+        return output
+
+    def _download_file(self, url, output_file, description="Saving dubbed video..."):
+        """Download `url` to `output_file`, in parallel ranges where the server allows."""
+        import requests
+        total = 0
+        accept_ranges = False
+        try:
+            head = self._session.head(url, timeout=30, allow_redirects=True)
+            # GET-scoped signed URLs often answer HEAD with 403/405; their
+            # error body's headers must not seed the size or range support.
+            if head.ok:
+                total = int(head.headers.get('content-length', 0))
+                accept_ranges = head.headers.get('accept-ranges', '').lower() == 'bytes'
+        except requests.RequestException:
+            pass
+
+        # Parallel ranges only pay off past a few MB; otherwise stream serially.
+        if accept_ranges and total >= 4 * 1024 * 1024:
+            if self._download_ranged(url, output_file, total, description):
+                return
+            # The server ignored Range on GET despite advertising it on HEAD
+            # (proxies strip the header); restream serially below.
+
+        with self._session.get(url, stream=True, timeout=120) as resp:
+            resp.raise_for_status()
+            resp.raw.decode_content = True
+            if not total:
+                total = int(resp.headers.get('content-length', 0))
+            # shutil.copyfileobj runs the chunk loop in C with a reused 1 MiB
+            # buffer instead of one Python iteration per 256 KiB chunk.
+            if total > 0:
+                with Progress(
+                    TextColumn("[progress.description]{task.description}"),
+                    BarColumn(),
+                    TextColumn("{task.percentage:>3.0f}%"),
+                    TimeRemainingColumn(),
+                    console=self.console
+                ) as progress:
+                    task = progress.add_task(description, total=total)
+                    with open(output_file, 'wb') as f:
+                        dst = _ProgressWriter(f, lambda n: progress.update(task, advance=n))
+                        shutil.copyfileobj(resp.raw, dst, length=1024 * 1024)
+            else:
+                with open(output_file, 'wb') as f:
+                    shutil.copyfileobj(resp.raw, f, length=1024 * 1024)
+
+    def _download_ranged(self, url, output_file, total, description, workers=8):
+        """Fetch `total` bytes of `url` as `workers` concurrent Range requests.
+
+        Returns True on success, or False — leaving the file incomplete — if
+        the server answers a Range request with anything but 206, so the
+        caller can fall back to a serial stream.
+        """
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        class _RangeIgnored(Exception):
+            pass
+
+        part = -(-total // workers)  # ceil division
+        fd = os.open(str(output_file), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            if hasattr(os, 'posix_fallocate'):
+                os.posix_fallocate(fd, 0, total)
+            lock = threading.Lock()
+            with Progress(
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                TextColumn("{task.percentage:>3.0f}%"),
+                TimeRemainingColumn(),
+                console=self.console
+            ) as progress:
+                task = progress.add_task(description, total=total)
+
+                def fetch_range(start):
+                    end = min(start + part, total) - 1
+                    written = 0
+                    pending = 0  # batch progress updates to cut Rich re-renders
+                    # identity encoding: transparently decoded bytes would
+                    # desync the start + written pwrite offsets below
+                    with self._session.get(url, stream=True, timeout=120,
+                                      headers={'Range': f'bytes={start}-{end}',
+                                               'Accept-Encoding': 'identity'}) as resp:
+                        resp.raise_for_status()
+                        if resp.status_code != 206:
+                            # a 200 means the full body: eight workers would
+                            # each pwrite it at their own offset
+                            raise _RangeIgnored
+                        while True:
+                            chunk = resp.raw.read(1024 * 1024)
+                            if not chunk:
+                                break
+                            os.pwrite(fd, chunk, start + written)
+                            written += len(chunk)
+                            pending += len(chunk)
+                            if pending >= 1024 * 1024:
+                                with lock:
+                                    progress.update(task, advance=pending)
+                                pending = 0
+                    if pending:
+                        with lock:
+                            progress.update(task, advance=pending)
+
+                with ThreadPoolExecutor(max_workers=workers) as ex:
+                    # list() propagates the first worker exception, if any
+                    try:
+                        list(ex.map(fetch_range, range(0, total, part)))
+                    except _RangeIgnored:
+                        return False
+        finally:
+            os.close(fd)
+        return True
 
     def check_environment(self):
         """Check all required environment variables and dependencies."""
@@ -175,19 +589,26 @@ class TwitterDubberCLI:
         self.console.print("  - ffmpeg: Found")
 
 
-    def test_video_download(self):
-        """Test downloading a video from Twitter."""
-        tweet_url = Prompt.ask(f"[{self.theme['accent']}]Enter tweet URL[/]")
-        # Normalize x.com to twitter.com (still Twitter-only)
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _normalize_tweet_url(url):
+        """Normalize x.com tweet URLs to twitter.com (still Twitter-only)."""
         try:
             from urllib.parse import urlparse, urlunparse
-            parsed = urlparse(tweet_url)
+            parsed = urlparse(url)
             if parsed.netloc.lower() == "x.com":
-                parsed = parsed._replace(netloc="twitter.com")
-                tweet_url = urlunparse(parsed)
-                self.console.print(f"[{self.theme['info']}]Normalized URL to[/] {tweet_url}")
-        except Exception:
+                return urlunparse(parsed._replace(netloc="twitter.com"))
+        except ValueError:
             pass
+        return url
+
+    def test_video_download(self):
+        """Test downloading a video from Twitter."""
+        tweet_url = Prompt.ask(f"[{self.theme['accent']}]Enter tweet URL[/]")
+        normalized = self._normalize_tweet_url(tweet_url)
+        if normalized != tweet_url:
+            tweet_url = normalized
+            self.console.print(f"[{self.theme['info']}]Normalized URL to[/] {tweet_url}")
         
         output_dir = Path(Prompt.ask(f"[{self.theme['accent']}]Output directory[/]", default=str(self.downloads_dir)))
         output_dir.mkdir(parents=True, exist_ok=True)
@@ -223,9 +644,7 @@ class TwitterDubberCLI:
         if not video_path.exists():
             self.console.print(f"[{self.theme['error']}]Error:[/] Video file not found at [underline]{video_path_str}[/]")
             # If not found, list a few recent candidates to help the user
-            recent_list = []
-            if self.downloads_dir.exists():
-                recent_list = sorted(self.downloads_dir.glob("*"), key=lambda p: p.stat().st_mtime, reverse=True)[:5]
+            recent_list = _list_by_mtime(self.downloads_dir)[:5]
             if recent_list:
                 self.console.print("Here are recent files in downloads:")
                 for p in recent_list:
@@ -261,37 +680,51 @@ class TwitterDubberCLI:
             return
 
         # Language selection
-        lang_codes = list(LANGUAGE_MAP.keys())
         lang_display = Text("\nAvailable languages:\n", style=self.theme['secondary'])
-        for code in lang_codes:
-            info = LANGUAGE_MAP[code]
+        for code, label in _LANG_DISPLAY_LINES:
             lang_display.append(f"  {code}  ", style=self.theme['accent'])
-            lang_display.append(f"{info['name']} ({info['code']})\n", style=self.theme['secondary'])
+            lang_display.append(f"{label}\n", style=self.theme['secondary'])
         self.console.print(lang_display)
-        target_code = Prompt.ask("Select language code", choices=lang_codes, default="en")
+        target_code = Prompt.ask("Select language code", choices=list(_LANG_CODES), default="en")
         target_locale = LANGUAGE_MAP[target_code]['code']
 
-        # Create Murf job
+        # Create Murf job (streamed multipart upload so large videos are never
+        # buffered whole in memory just to compute Content-Length)
         try:
-            import mimetypes
-            import webbrowser
-            from requests import Session
-            session = Session()
+            from requests_toolbelt.multipart.encoder import MultipartEncoder, MultipartEncoderMonitor
 
             self.console.print(Panel("Creating Murf dubbing job...", border_style=self.theme['panel_border']))
             with open(video_path, 'rb') as fh:
-                files = {
-                    'file': (video_path.name, fh, mimetypes.guess_type(str(video_path))[0] or 'video/mp4'),
-                }
-                data = {
+                # The upload is strictly sequential; tell the kernel so it
+                # reads ahead and drops pages behind us. (sendfile-style
+                # zero-copy is off the table: the Murf socket is TLS.)
+                if hasattr(os, 'posix_fadvise'):
+                    try:
+                        os.posix_fadvise(fh.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                    except OSError:
+                        pass
+                encoder = MultipartEncoder(fields={
+                    'file': (video_path.name, fh, _guess_mime(video_path.suffix.lower())),
                     'file_name': video_path.name,
                     'priority': 'LOW',
                     'target_locales': target_locale,
-                }
-                headers = { 'api-key': api_key }
-                resp = session.post('https://api.murf.ai/v1/murfdub/jobs/create', files=files, data=data, headers=headers, timeout=60)
+                })
+                with Progress(
+                    TextColumn("[progress.description]{task.description}"),
+                    BarColumn(),
+                    TextColumn("{task.percentage:>3.0f}%"),
+                    TimeRemainingColumn(),
+                    console=self.console,
+                    transient=True
+                ) as progress:
+                    task = progress.add_task("Uploading video to Murf...", total=encoder.len)
+                    monitor = MultipartEncoderMonitor(
+                        encoder, lambda m: progress.update(task, completed=m.bytes_read)
+                    )
+                    headers = { 'api-key': api_key, 'Content-Type': monitor.content_type }
+                    resp = self._session.post('https://api.murf.ai/v1/murfdub/jobs/create', data=monitor, headers=headers, timeout=60)
                 resp.raise_for_status()
-                job_id = resp.json().get('job_id')
+                job_id = _json_loads(resp.content).get('job_id')
                 if not job_id:
                     raise RuntimeError(f"Unexpected response from Murf: {resp.text}")
         except Exception as e:
@@ -302,26 +735,14 @@ class TwitterDubberCLI:
         self.console.print(f"[{self.theme['info']}]Job created:[/] {job_id}. Polling status...")
         download_url = None
         try:
+            import asyncio
             with Progress(
                 SpinnerColumn(style=self.theme['accent']),
                 TextColumn("[progress.description]{task.description}"),
                 console=self.console
             ) as progress:
                 task = progress.add_task("Waiting for Murf to complete...", total=None)
-                for i in range(120):  # up to ~6 minutes
-                    status_resp = session.get(f'https://api.murf.ai/v1/murfdub/jobs/{job_id}/status', headers={ 'api-key': api_key }, timeout=30)
-                    status_resp.raise_for_status()
-                    data = status_resp.json()
-                    status = data.get('status')
-                    if status == 'COMPLETED':
-                        details = next((d for d in data.get('download_details', []) if d.get('download_url')), None)
-                        if not details:
-                            raise RuntimeError('Murf completed, but no download details found')
-                        download_url = details['download_url']
-                        break
-                    if status == 'FAILED':
-                        raise RuntimeError(f"Murf failed: {data.get('failure_reason') or 'Unknown error'}")
-                    time.sleep(3)
+                download_url = asyncio.run(self._poll_murf_job(job_id, api_key))
                 progress.update(task, completed=True)
         except Exception as e:
             self.console.print(f"[{self.theme['error']}]Polling failed:[/] {e}")
@@ -337,29 +758,7 @@ class TwitterDubberCLI:
                 safe_name = f"dubbed_{int(time.time())}_{target_code}.mp4"
                 output_file = self.dubbed_dir / safe_name
 
-                with requests.get(download_url, stream=True, timeout=120) as resp:
-                    resp.raise_for_status()
-                    total = int(resp.headers.get('content-length', 0))
-                    chunk_size = 1024 * 256
-                    if total > 0:
-                        with Progress(
-                            TextColumn("[progress.description]{task.description}"),
-                            BarColumn(),
-                            TextColumn("{task.percentage:>3.0f}%"),
-                            TimeRemainingColumn(),
-                            console=self.console
-                        ) as progress:
-                            task = progress.add_task("Saving dubbed video...", total=total)
-                            with open(output_file, 'wb') as f:
-                                for chunk in resp.iter_content(chunk_size=chunk_size):
-                                    if chunk:
-                                        f.write(chunk)
-                                        progress.update(task, advance=len(chunk))
-                    else:
-                        with open(output_file, 'wb') as f:
-                            for chunk in resp.iter_content(chunk_size=chunk_size):
-                                if chunk:
-                                    f.write(chunk)
+                self._download_file(download_url, output_file)
 
                 self.console.print(f"[{self.theme['success']}]Saved to:[/] [underline]{output_file}[/]")
                 if Confirm.ask("Open saved file?", default=False):
@@ -375,21 +774,15 @@ class TwitterDubberCLI:
 
     def test_complete_flow(self):
         """Test the complete dubbing flow via local Firebase function (emulator)."""
+        import requests
         # Gather inputs
         tweet_url = Prompt.ask(f"[{self.theme['accent']}]Enter tweet URL[/]")
-        # Normalize x.com to twitter.com
-        try:
-            from urllib.parse import urlparse, urlunparse
-            parsed = urlparse(tweet_url)
-            if parsed.netloc.lower() == "x.com":
-                parsed = parsed._replace(netloc="twitter.com")
-                tweet_url = urlunparse(parsed)
-                self.console.print(f"[{self.theme['info']}]Normalized URL to[/] {tweet_url}")
-        except Exception:
-            pass
+        normalized = self._normalize_tweet_url(tweet_url)
+        if normalized != tweet_url:
+            tweet_url = normalized
+            self.console.print(f"[{self.theme['info']}]Normalized URL to[/] {tweet_url}")
 
-        lang_codes = list(LANGUAGE_MAP.keys())
-        target_code = Prompt.ask("Select language code", choices=lang_codes, default="en")
+        target_code = Prompt.ask("Select language code", choices=list(_LANG_CODES), default="en")
         target_language = LANGUAGE_MAP[target_code]['name']  # backend accepts code or name
 
         # Ensure emulator is running
@@ -410,7 +803,7 @@ class TwitterDubberCLI:
                 console=self.console
             ) as progress:
                 task = progress.add_task("Processing (this may take several minutes)...", total=None)
-                response = requests.get(url, params=params, timeout=600)
+                response = self._session.get(url, params=params, timeout=600)
                 progress.update(task, completed=True)
         except requests.RequestException as e:
             self.console.print(f"[{self.theme['error']}]Request failed:[/] {e}")
@@ -424,15 +817,15 @@ class TwitterDubberCLI:
         if not response.ok:
             self.console.print(f"[{self.theme['error']}]Emulator returned {response.status_code}[/]")
             try:
-                self.console.print(response.json())
-            except Exception:
+                self.console.print(_json_loads(response.content))
+            except ValueError:
                 self.console.print(response.text)
             self.console.print(f"[{self.theme['info']}]Tip:[/] Ensure the emulator was started from the repo root ({self.repo_root}) so functions load.")
             return
 
         try:
-            data = response.json()
-        except Exception:
+            data = _json_loads(response.content)
+        except ValueError:
             self.console.print(f"[{self.theme['error']}]Failed to parse JSON response.[/]")
             self.console.print(response.text)
             return
@@ -452,29 +845,7 @@ class TwitterDubberCLI:
             safe_name = f"dubbed_{int(time.time())}_{target_code}.mp4"
             output_file = self.dubbed_dir / safe_name
 
-            with requests.get(dubbed_url, stream=True, timeout=120) as resp:
-                resp.raise_for_status()
-                total = int(resp.headers.get('content-length', 0))
-                chunk_size = 1024 * 256
-                if total > 0:
-                    with Progress(
-                        TextColumn("[progress.description]{task.description}"),
-                        BarColumn(),
-                        TextColumn("{task.percentage:>3.0f}%"),
-                        TimeRemainingColumn(),
-                        console=self.console
-                    ) as progress:
-                        task = progress.add_task("Saving dubbed video...", total=total)
-                        with open(output_file, 'wb') as f:
-                            for chunk in resp.iter_content(chunk_size=chunk_size):
-                                if chunk:
-                                    f.write(chunk)
-                                    progress.update(task, advance=len(chunk))
-                else:
-                    with open(output_file, 'wb') as f:
-                        for chunk in resp.iter_content(chunk_size=chunk_size):
-                            if chunk:
-                                f.write(chunk)
+            self._download_file(dubbed_url, output_file)
 
             self.console.print(f"[{self.theme['success']}]Saved to:[/] [underline]{output_file}[/]")
             if Confirm.ask("Open saved file?", default=False):
@@ -488,12 +859,15 @@ class TwitterDubberCLI:
 
     def view_logs(self):
         """View Firebase function logs."""
+        import requests
+        from rich.syntax import Syntax  # lazy: pygments is expensive at import
+
         self.console.print(Panel("Fetching Firebase Logs...", border_style=self.theme['panel_border']))
 
         # If emulator is running, offer to open Functions UI directly (most reliable)
         emulator_running = False
         try:
-            r = requests.get("http://127.0.0.1:4000/", timeout=1.5)
+            r = self._session.get("http://127.0.0.1:4000/", timeout=1.5)
             emulator_running = r.ok
         except requests.RequestException:
             emulator_running = False
@@ -513,10 +887,9 @@ class TwitterDubberCLI:
             pass
 
         # Fallback: read latest firebase-debug*.log and filter for useful lines (recent window)
-        try:
-            debug_candidates = sorted(self.repo_root.glob('firebase-debug*.log'), key=lambda p: p.stat().st_mtime, reverse=True)
-        except Exception:
-            debug_candidates = []
+        debug_candidates = _list_by_mtime(
+            self.repo_root, lambda n: n.startswith('firebase-debug') and n.endswith('.log')
+        )
 
         if not debug_candidates:
             self.console.print(f"[{self.theme['warning']}]No local emulator logs found. Start the emulator or view logs at http://127.0.0.1:4000.[/]")
@@ -524,44 +897,37 @@ class TwitterDubberCLI:
 
         debug_log = debug_candidates[0]
         try:
-            import re
             from datetime import datetime, timezone, timedelta
 
-            lines = debug_log.read_text(errors='ignore').splitlines()
             # Keep last 1000 lines, then filter recent 15 minutes by timestamp if present
-            tail = lines[-1000:]
-            ts_re = re.compile(r"\[(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d+Z)\]")
+            tail = _tail_lines(debug_log, 1000)
             now = datetime.now(timezone.utc)
             recent = []
             for ln in tail:
-                m = ts_re.search(ln)
+                m = _TS_RE.search(ln)
                 if not m:
                     recent.append(ln)
                     continue
                 try:
-                    ts = datetime.fromisoformat(m.group(1).replace('Z', '+00:00'))
+                    ts = datetime.fromisoformat(m.group(1).decode().replace('Z', '+00:00'))
                     if now - ts <= timedelta(minutes=15):
                         recent.append(ln)
                 except Exception:
                     recent.append(ln)
 
             # Keyword filter: keep lines about our functions and useful levels, drop noisy frames/EPIPE
-            keywords = (
-                'functions[', 'us-central1-', 'dubVideo', 'handleDubbing', 'handleMention',
-                'Created Murf Job', 'Dubbed video URL', 'Downloading video', 'Video downloaded successfully',
-                'Murf', 'ERROR', 'INFO', '[error]', '[info]'
-            )
             filtered = []
             for ln in recent:
                 s = ln.strip()
                 if not s:
                     continue
-                if 'Error: write EPIPE' in s or s.startswith('at '):
+                if b'Error: write EPIPE' in s or s.startswith(b'at '):
                     continue
-                if any(k in s for k in keywords):
+                if _KW_RE.search(s):
                     filtered.append(s)
 
-            display = "\n".join(filtered[-300:] if filtered else recent[-200:])
+            # Decode only the lines that will actually be shown
+            display = b"\n".join(filtered[-300:] if filtered else recent[-200:]).decode('utf-8', errors='ignore')
             self.console.print(Panel(f"{debug_log.name} (filtered, recent)", border_style=self.theme['panel_border']))
             self.console.print(Syntax(display, "log", theme="monokai", line_numbers=True))
             if emulator_running:
@@ -570,13 +936,24 @@ class TwitterDubberCLI:
             self.console.print(f"[{self.theme['error']}]Failed to process emulator log:[/] {e}")
             self.console.print(f"[{self.theme['info']}]Tip:[/] Open Emulator UI at http://127.0.0.1:4000")
 
+    def _probe_endpoint(self, url):
+        """Return a short status string ("up", "down", "http NNN") for a function endpoint."""
+        import requests
+        try:
+            r = self._session.get(url, timeout=2)
+            # 200/400/404 still indicates the emulator is serving the function entrypoint
+            return "up" if r.status_code in (200, 400, 404) else f"http {r.status_code}"
+        except requests.RequestException:
+            return "down"
+
     def check_emulator_status(self):
         """Check Firebase emulator status."""
+        import requests
         self.console.print(Panel("Checking Firebase Emulator Status...", border_style=self.theme['panel_border']))
 
         ui_ok = False
         try:
-            response = requests.get("http://127.0.0.1:4000/", timeout=2)
+            response = self._session.get("http://127.0.0.1:4000/", timeout=2)
             ui_ok = bool(response.ok)
         except requests.RequestException:
             ui_ok = False
@@ -592,23 +969,18 @@ class TwitterDubberCLI:
                 return
 
         # Probe known function endpoints quickly to indicate availability
-        endpoints = {
-            'dubVideo': f"{FIREBASE_EMULATOR_URL}/dubVideo",
-            'handleDubbing': f"{FIREBASE_EMULATOR_URL}/handleDubbing",
-            'handleMention': f"{FIREBASE_EMULATOR_URL}/handleMention",
-        }
+        endpoints = _FUNCTION_ENDPOINTS
         summary = Text()
         summary.append("\nEmulator UI: ", style=self.theme['primary'])
         summary.append("http://127.0.0.1:4000\n", style=self.theme['secondary'])
         
-        for name, url in endpoints.items():
-            status = "down"
-            try:
-                r = requests.get(url, timeout=2)
-                # 200/400/404 still indicates the emulator is serving the function entrypoint
-                status = "up" if r.status_code in (200, 400, 404) else f"http {r.status_code}"
-            except requests.RequestException:
-                status = "down"
+        # The probes are independent I/O; run them concurrently so the wall
+        # clock is max(timeouts) instead of their sum when endpoints are down.
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=len(endpoints)) as ex:
+            results = list(ex.map(lambda kv: (kv[0], kv[1], self._probe_endpoint(kv[1])), endpoints.items()))
+
+        for name, url, status in results:
             symbol = "✓" if status == "up" else "×"
             color = self.theme['success'] if status == "up" else self.theme['error']
             summary.append(f"{name}: ", style=self.theme['primary'])
@@ -620,27 +992,78 @@ class TwitterDubberCLI:
             import webbrowser
             webbrowser.open("http://127.0.0.1:4000/functions")
 
+    @staticmethod
+    def _emulator_ports_ready(timeout=0.3):
+        """Cheap TCP connect probe for both emulator ports (4000 UI, 5001 functions).
+
+        Readiness only needs the ports to accept, so this skips the HTTP
+        request/response machinery entirely. The UI and the functions host
+        come up at slightly different times, so both connects are issued
+        non-blocking and multiplexed on one selector pass instead of two
+        sequential timed connects — the probe returns as soon as both
+        accept (or either refuses).
+        """
+        import errno
+        import selectors
+        sel = selectors.DefaultSelector()
+        socks = []
+        try:
+            pending = 0
+            for port in (4000, 5001):
+                # An explicit AF_INET socket plus a literal address keeps the
+                # probe off getaddrinfo, and TCP_NODELAY (set before connect,
+                # inherited by the connection) stops Nagle from delaying the
+                # handshake on loopback.
+                s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                s.setblocking(False)
+                socks.append(s)
+                err = s.connect_ex(('127.0.0.1', port))
+                if err == 0:
+                    continue  # loopback connected on the spot
+                if err != errno.EINPROGRESS:
+                    return False
+                sel.register(s, selectors.EVENT_WRITE)
+                pending += 1
+            deadline = time.monotonic() + timeout
+            while pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                for key, _ in sel.select(remaining):
+                    sel.unregister(key.fileobj)
+                    if key.fileobj.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) != 0:
+                        return False
+                    pending -= 1
+            return True
+        finally:
+            sel.close()
+            for s in socks:
+                s.close()
+
     def _ensure_emulator_running(self, wait_seconds: int = 45) -> bool:
         """Ensure the Firebase Emulator Suite (UI) is reachable; optionally start it and wait until ready."""
-        try:
-            resp = requests.get("http://127.0.0.1:4000/", timeout=1)
-            if resp.ok:
-                return True
-        except requests.RequestException:
-            pass
+        if self._emulator_ports_ready(timeout=1):
+            return True
 
         if not Confirm.ask("Firebase emulator is not running. Start it now?", default=True):
             return False
 
         # Start emulator in background from repo root so functions register correctly
         try:
-            with open(os.devnull, 'w') as devnull:
-                subprocess.Popen(
-                    ['firebase', 'emulators:start', '--only', 'functions'],
-                    cwd=str(self.repo_root),
-                    stdout=devnull,
-                    stderr=devnull
-                )
+            # start_new_session detaches the emulator from our terminal so a
+            # Ctrl+C in the CLI doesn't take it down. (This still forks:
+            # cwd/start_new_session/close_fds each rule out CPython's
+            # posix_spawn path — the point here is lifetime, not spawn speed.)
+            subprocess.Popen(
+                ['firebase', 'emulators:start', '--only', 'functions'],
+                cwd=str(self.repo_root),
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                start_new_session=True,
+                close_fds=True
+            )
         except Exception as e:
             self.console.print(f"[{self.theme['error']}]Failed to start emulator:[/] {e}")
             return False
@@ -649,63 +1072,114 @@ class TwitterDubberCLI:
         self.console.print(Panel("Starting emulator (waiting for readiness)...", border_style=self.theme['panel_border']))
         start_time = time.time()
         with Progress(SpinnerColumn(style=self.theme['accent']), TextColumn("[progress.description]{task.description}"), console=self.console) as progress:
-            task = progress.add_task("Waiting for Emulator UI at 127.0.0.1:4000...", total=None)
+            task = progress.add_task("Waiting for emulator ports 4000 (UI) and 5001 (functions)...", total=None)
+            # Probe fast and back off (0.1s doubling to 1s): readiness is
+            # usually detected within a fraction of the old 1.5s interval,
+            # and each raw TCP probe costs only a loopback connect.
+            attempt = 0
             while time.time() - start_time < wait_seconds:
-                try:
-                    r = requests.get("http://127.0.0.1:4000/", timeout=1)
-                    if r.ok:
-                        progress.update(task, completed=True)
-                        return True
-                except requests.RequestException:
-                    pass
-                time.sleep(1.5)
+                if self._emulator_ports_ready():
+                    progress.update(task, completed=True)
+                    return True
+                time.sleep(min(1.0, 0.1 * 2 ** attempt))
+                attempt += 1
         self.console.print(f"[{self.theme['error']}]Emulator did not become ready within {wait_seconds}s.[/]")
         return False
 
     def show_configuration(self):
         """Show and edit configuration."""
         self.console.print(Panel("Displaying Current Configuration...", border_style=self.theme['panel_border']))
-        
-        config_text = Text()
+
+        # Collect (text, style) tuples and assemble the Text once at the end;
+        # Text.assemble pre-sizes its span array instead of growing per append.
+        # The theme styles used in the append loops are bound to locals once,
+        # trading ~100 attribute+subscript lookups for LOAD_FASTs.
+        parts = []
+        primary = self.theme['primary']
+        secondary = self.theme['secondary']
+        warning = self.theme['warning']
+        error = self.theme['error']
+
+        # Version/project probes are independent subprocesses; run them all
+        # concurrently so the display takes max(t_i) instead of sum(t_i).
+        from concurrent.futures import ThreadPoolExecutor
+
+        probes = {
+            'firebase': ['firebase', '--version'],
+            'projects': ['firebase', 'projects:list'],
+            'yt-dlp': ['yt-dlp', '--version'],
+            'ffmpeg': ['ffmpeg', '-version'],
+            'node': ['node', '--version'],
+        }
+        # Skip forks that are doomed: a tool missing from PATH still costs a
+        # failed exec, and shutil.which answers without spawning anything.
+        results = {}
+        for name, cmd in list(probes.items()):
+            if shutil.which(cmd[0]) is None:
+                results[name] = FileNotFoundError(f"{cmd[0]} is not on PATH") if name == 'projects' else "not installed"
+                del probes[name]
+        with Progress(
+            SpinnerColumn(style=self.theme['accent']),
+            TextColumn("[progress.description]{task.description}"),
+            console=self.console,
+            transient=True
+        ) as progress:
+            progress.add_task("Checking tools and project list...", total=None)
+            # max(1, ...): every tool may be missing, and an executor
+            # with zero workers raises ValueError.
+            with ThreadPoolExecutor(max_workers=max(1, len(probes))) as ex:
+                # Version probes are stable for a day; the project list rarely
+                # changes either, but its cache key tracks the active
+                # credentials and it expires after an hour.
+                futures = {
+                    name: ex.submit(
+                        self._cached_output, cmd, 3600,
+                        os.getenv('GOOGLE_APPLICATION_CREDENTIALS', '')
+                    ) if name == 'projects' else ex.submit(self._cached_output, cmd)
+                    for name, cmd in probes.items()
+                }
+                for name, future in futures.items():
+                    try:
+                        results[name] = future.result()
+                    except Exception as e:
+                        results[name] = e
+
+        def get_version(name, fallback="unknown"):
+            out = results[name]
+            if isinstance(out, Exception):
+                return fallback
+            return out.splitlines()[0].strip() if out.strip() else fallback
 
         # Firebase project info and versions
-        try:
-            firebase_ver = self._run_subprocess(['firebase', '--version'], "Checking firebase-tools version...").strip()
-        except Exception:
-            firebase_ver = "unknown"
-        config_text.append("firebase-tools: ", style=self.theme['primary'])
-        config_text.append(f"{firebase_ver}\n", style=self.theme['secondary'])
+        firebase_ver = get_version('firebase')
+        parts.append(("firebase-tools: ", primary))
+        parts.append((f"{firebase_ver}\n", secondary))
 
         projects_hint = None
-        try:
-            project_list = self._run_subprocess(['firebase', 'projects:list'], "Fetching projects...")
-        except Exception as e:
-            project_list = f"Failed to fetch: {e}"
+        project_list = results['projects']
+        if isinstance(project_list, Exception):
+            project_list = f"Failed to fetch: {project_list}"
             projects_hint = (
                 "Hint: Run `firebase login` to authenticate, then `firebase projects:list` "
                 "and `firebase use --add` to select a default project."
             )
-        config_text.append("Projects:\n", style=self.theme['primary'])
-        config_text.append(project_list + ("\n" if not project_list.endswith("\n") else ""), style=self.theme['secondary'])
+        parts.append(("Projects:\n", primary))
+        parts.append((project_list + ("\n" if not project_list.endswith("\n") else ""), secondary))
         if projects_hint:
-            config_text.append(projects_hint + "\n", style=self.theme['warning'])
+            parts.append((projects_hint + "\n", warning))
 
         # Tooling versions
-        def get_version(cmd, fallback="unknown"):
-            try:
-                return self._run_subprocess(cmd, f"Checking {' '.join(cmd)}...").splitlines()[0].strip()
-            except Exception:
-                return fallback
-        yt_ver = get_version(['yt-dlp', '--version'])
-        ffmpeg_ver = get_version(['ffmpeg', '-version'])
-        node_ver = get_version(['node', '--version'])
-        python_ver = get_version([sys.executable, '--version'])
-
-        config_text.append("\nTools:\n", style=self.theme['primary'])
-        config_text.append(f"  yt-dlp: {yt_ver}\n", style=self.theme['secondary'])
-        config_text.append(f"  ffmpeg: {ffmpeg_ver}\n", style=self.theme['secondary'])
-        config_text.append(f"  node:   {node_ver}\n", style=self.theme['secondary'])
-        config_text.append(f"  python: {python_ver}\n", style=self.theme['secondary'])
+        yt_ver = get_version('yt-dlp')
+        ffmpeg_ver = get_version('ffmpeg')
+        node_ver = get_version('node')
+        # The running interpreter already knows its version; no fork needed
+        python_ver = f"Python {sys.version.split()[0]}"
+
+        parts.append(("\nTools:\n", primary))
+        parts.append((f"  yt-dlp: {yt_ver}\n", secondary))
+        parts.append((f"  ffmpeg: {ffmpeg_ver}\n", secondary))
+        parts.append((f"  node:   {node_ver}\n", secondary))
+        parts.append((f"  python: {python_ver}\n", secondary))
 
         # Directories
         try:
@@ -713,35 +1187,60 @@ class TwitterDubberCLI:
             self.dubbed_dir.mkdir(parents=True, exist_ok=True)
         except Exception:
             pass
-        dl_count = len(list(self.downloads_dir.glob('*')))
-        dub_count = len(list(self.dubbed_dir.glob('*')))
-        config_text.append("\nDirectories:\n", style=self.theme['primary'])
-        config_text.append(f"  downloads: {self.downloads_dir} ({dl_count} items)\n", style=self.theme['secondary'])
-        config_text.append(f"  dubbed:    {self.dubbed_dir} ({dub_count} items)\n", style=self.theme['secondary'])
+        def _count(path, cap=10_000):
+            # scandir iterates getdents directly: no Path objects, no per-entry
+            # stat. The count only conveys order of magnitude, so stop reading
+            # the directory at `cap` entries and render "10000+".
+            n = 0
+            try:
+                with os.scandir(path) as it:
+                    for _ in it:
+                        n += 1
+                        if n >= cap:
+                            return f"{cap}+"
+            except OSError:
+                pass
+            return str(n)
+        dl_count = _count(self.downloads_dir)
+        dub_count = _count(self.dubbed_dir)
+        parts.append(("\nDirectories:\n", primary))
+        parts.append((f"  downloads: {self.downloads_dir} ({dl_count} items)\n", secondary))
+        parts.append((f"  dubbed:    {self.dubbed_dir} ({dub_count} items)\n", secondary))
 
         # Env vars (masked)
         masked_vars = ['API_KEY', 'API_KEY_SECRET', 'ACCESS_TOKEN', 'ACCESS_TOKEN_SECRET', 'MURF_API_KEY', 'OPENAI_API_KEY']
-        config_text.append("\nEnvironment:\n", style=self.theme['primary'])
+        parts.append(("\nEnvironment:\n", primary))
         for var in masked_vars:
             value = os.getenv(var, '')
-            masked = f"{value[:4]}...{value[-4:]}" if value and len(value) > 8 else ("set" if value else "Not Set")
-            color = self.theme['secondary'] if value else self.theme['error']
-            config_text.append(f"  {var}: ", style=self.theme['secondary'])
-            config_text.append(f"{masked}\n", style=color)
+            # join pre-sums the segment lengths, so one allocation per mask
+            masked = ''.join((value[:4], '...', value[-4:])) if len(value) > 8 else ('set' if value else 'Not Set')
+            color = secondary if value else error
+            parts.append((''.join(('  ', var, ': ')), secondary))
+            parts.append((masked + '\n', color))
 
         # Emulator endpoints
-        config_text.append("\nEmulator Endpoints:\n", style=self.theme['primary'])
-        config_text.append("  UI:           http://127.0.0.1:4000\n", style=self.theme['secondary'])
-        config_text.append(f"  dubVideo:     {FIREBASE_EMULATOR_URL}/dubVideo\n", style=self.theme['secondary'])
-        config_text.append(f"  handleDubbing:{FIREBASE_EMULATOR_URL}/handleDubbing\n", style=self.theme['secondary'])
-        config_text.append(f"  handleMention:{FIREBASE_EMULATOR_URL}/handleMention\n", style=self.theme['secondary'])
+        parts.append(("\nEmulator Endpoints:\n", primary))
+        for line in _EMULATOR_ENDPOINT_LINES:
+            parts.append((line, secondary))
 
-        self.console.print(config_text)
+        self.console.print(Text.assemble(*parts))
 
-if __name__ == '__main__':
+def main():
+    """Entry point; returns a process exit code.
+
+    Function scope (rather than module-level script code) lets CPython's
+    adaptive interpreter specialize the bytecode and keeps the bootstrap
+    hoistable by AOT tools.
+    """
     try:
-        cli = TwitterDubberCLI()
-        cli.run()
+        if '--refresh-versions' in sys.argv or '--refresh-projects' in sys.argv:
+            _VERSIONS_FILE.unlink(missing_ok=True)
+        TwitterDubberCLI().run()
+        return 0
     except Exception as e:
-        console.print(f"[{'bold red'}]A fatal error occurred: {e}[/]")
-        sys.exit(1)
\ No newline at end of file
+        console.print(f"[bold red]A fatal error occurred: {e}[/]")
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
\ No newline at end of file